@@ -1,7 +1,12 @@
+import io
+import os
 import unittest
 import time
 from tests.test_ultra_bst import TestBSTConstraints, TestBSTIntegration
 
+# Opt-in: stop at the first failure instead of running the whole suite
+FAST_FAIL = os.environ.get("EVAL_FAST_FAIL") == "1"
+
 
 def run_tests():
     """Run all tests, measure execution time, and print a detailed summary"""
@@ -10,7 +15,7 @@ def run_tests():
     print("=" * 70)
     print()
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
@@ -18,10 +23,12 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestBSTConstraints))
     suite.addTests(loader.loadTestsFromTestCase(TestBSTIntegration))
 
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Per-test output goes to an in-memory stream; only failures are echoed below
+    runner = unittest.TextTestRunner(stream=io.StringIO(), verbosity=0, buffer=True,
+                                     failfast=FAST_FAIL)
     result = runner.run(suite)
 
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
 
     print()
     print("=" * 70)
@@ -35,19 +42,24 @@ def run_tests():
         print("\nFailed Tests:")
         for test, traceback in result.failures:
             print(f"- {test}")
+            print(traceback)
     print(f"Errors: {len(result.errors)}")
     if result.errors:
         print("\nTests with Errors:")
         for test, traceback in result.errors:
             print(f"- {test}")
+            print(traceback)
     print("=" * 70)
 
+    report = (
+        f"Total Execution Time: {elapsed_time:.2f} seconds\n"
+        f"Tests Run: {result.testsRun}\n"
+        f"Successes: {result.testsRun - len(result.failures) - len(result.errors)}\n"
+        f"Failures: {len(result.failures)}\n"
+        f"Errors: {len(result.errors)}\n"
+    )
     with open("evaluation_report.txt", "w") as f:
-        f.write(f"Total Execution Time: {elapsed_time:.2f} seconds\n")
-        f.write(f"Tests Run: {result.testsRun}\n")
-        f.write(f"Successes: {result.testsRun - len(result.failures) - len(result.errors)}\n")
-        f.write(f"Failures: {len(result.failures)}\n")
-        f.write(f"Errors: {len(result.errors)}\n")
+        f.write(report)
 
     return result.wasSuccessful()
 
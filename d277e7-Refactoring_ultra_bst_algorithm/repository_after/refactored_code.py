@@ -1,24 +1,39 @@
-from typing import Optional, Callable, TypeVar, Iterator, Dict
-from dataclasses import dataclass
+from typing import Optional, Callable, TypeVar, Deque, Iterable, Iterator, List, Tuple
+from collections import deque
+from functools import cmp_to_key
+from itertools import chain, repeat, starmap
 
 T = TypeVar('T')
 
-@dataclass
-class NodeMetadata:
-    """Minimal metadata - only what's needed for duplicates"""
-    duplicate_count: int = 1
-
 class BSTNode:
-    """Streamlined node - only essential fields"""
-    __slots__ = ('key', 'value', 'left', 'right', 'height', 'metadata')
+    """
+    Streamlined node - only essential fields.
     
-    def __init__(self, key, value=None):
-        self.key = key
-        self.value = value if value is not None else key
+    key, value and duplicate_count are read-only: snapshots share nodes with
+    the live tree, so only BST writes them, after copying any shared node.
+    """
+    __slots__ = ('_key', '_value', 'left', 'right', 'height', '_duplicate_count', 'version')
+    
+    def __init__(self, key, value=None, version: int = 0):
+        self._key = key
+        self._value = value if value is not None else key
         self.left: Optional['BSTNode'] = None
         self.right: Optional['BSTNode'] = None
         self.height: int = 1
-        self.metadata: NodeMetadata = NodeMetadata()
+        self._duplicate_count: int = 1
+        self.version: int = version
+    
+    @property
+    def key(self):
+        return self._key
+    
+    @property
+    def value(self):
+        return self._value
+    
+    @property
+    def duplicate_count(self) -> int:
+        return self._duplicate_count
     
     def update_height(self) -> int:
         """Update height and return balance factor"""
@@ -27,18 +42,14 @@ class BSTNode:
         self.height = 1 + max(left_h, right_h)
         return right_h - left_h
     
-    def clone(self) -> 'BSTNode':
-        """Deep clone for snapshots"""
-        new_node = BSTNode(self.key, self.value)
-        new_node.height = self.height
-        new_node.metadata.duplicate_count = self.metadata.duplicate_count
-        
-        if self.left:
-            new_node.left = self.left.clone()
-        if self.right:
-            new_node.right = self.right.clone()
-        
-        return new_node
+    def copy(self, version: int) -> 'BSTNode':
+        """Shallow copy sharing both children, stamped with a new version"""
+        node = BSTNode(self._key, self._value, version)
+        node.left = self.left
+        node.right = self.right
+        node.height = self.height
+        node._duplicate_count = self._duplicate_count
+        return node
 
 class BST:
     """
@@ -48,17 +59,28 @@ class BST:
     Features:
     - O(log n) insert/search with AVL self-balancing
     - Duplicate counting strategy for repeated keys
-    - Snapshot/rollback system for audit compliance
+    - Snapshot/rollback system for audit compliance (nodes returned by
+      insert/search are read-only; change values with update_value)
     - Deterministic behavior (no timestamps or random state)
     """
     
-    def __init__(self, comparator: Optional[Callable[[any, any], int]] = None):
+    def __init__(self, comparator: Optional[Callable[[any, any], int]] = None,
+                 max_snapshots: Optional[int] = None):
+        if max_snapshots is not None and max_snapshots < 1:
+            raise ValueError("max_snapshots must be at least 1")
         self.root: Optional[BSTNode] = None
         self._size: int = 0
-        self._comparator = comparator or (lambda a, b: (a > b) - (a < b))
-        self._snapshots: Dict[int, BSTNode] = {}
-        self._snapshot_sizes: Dict[int, int] = {}
-        self._version_counter: int = 0
+        self._comparator = comparator
+        self._default_cmp: bool = comparator is None
+        # Versions are dense indices: snapshot v is (root, size) at _snapshots[v],
+        # or None once it has been dropped. Snapshots share nodes with the live
+        # tree; nodes stamped with an older epoch are copied before any write.
+        self._epoch: int = 0
+        self._snapshots: List[Optional[Tuple[Optional[BSTNode], int]]] = []
+        self._max_snapshots = max_snapshots
+        self._live_versions: Deque[int] = deque()
+        # Sorted (key, duplicate_count) runs, rebuilt lazily after any mutation
+        self._inorder_cache: Optional[Tuple[Tuple[any, int], ...]] = None
     
     def insert(self, key, value=None) -> BSTNode:
         """
@@ -69,66 +91,255 @@ class BST:
             value: Optional value (defaults to key if None)
         
         Returns:
-            The inserted or updated node
+            The inserted or updated node. It is read-only and reflects the
+            tree only until the next create_snapshot or rollback, after which
+            writes go to a copy of the node.
         """
+        self._inorder_cache = None
         if self.root is None:
-            self.root = BSTNode(key, value)
+            self.root = BSTNode(key, value, self._epoch)
             self._size += 1
             return self.root
         
         # Check for duplicate first
         existing = self._find_exact(self.root, key)
         if existing:
-            existing.metadata.duplicate_count += 1
+            if existing.version != self._epoch:
+                existing = self._copy_path(key)
+            existing._duplicate_count += 1
             if value is not None:
-                existing.value = value
+                existing._value = value
             self._size += 1
             return existing
         
         # Insert and collect path for rebalancing
-        self.root = self._insert_and_balance(self.root, key, value)
+        node = self._insert_and_balance(key, value)
         self._size += 1
-        return self.root
+        return node
+    
+    def bulk_load(self, keys: Iterable) -> None:
+        """
+        Insert many keys at once.
+        
+        On an empty tree the keys are sorted once and a perfectly balanced
+        tree is built directly, with no rotations. On a non-empty tree this
+        falls back to inserting each key.
+        
+        Args:
+            keys: Keys to insert (values default to the keys)
+        """
+        if self.root is not None:
+            for key in keys:
+                self.insert(key)
+            return
+        
+        self._inorder_cache = None
+        
+        if self._default_cmp:
+            ordered = sorted(keys)
+        else:
+            ordered = sorted(keys, key=cmp_to_key(self._comparator))
+        if not ordered:
+            return
+        
+        # Collapse equal neighbours into (key, duplicate_count) runs
+        unique = [ordered[0]]
+        counts = [1]
+        comparator = self._comparator
+        default_cmp = self._default_cmp
+        for key in ordered[1:]:
+            last = unique[-1]
+            if default_cmp:
+                equal = not (last < key or key < last)
+            else:
+                equal = comparator(key, last) == 0
+            if equal:
+                counts[-1] += 1
+            else:
+                unique.append(key)
+                counts.append(1)
+        
+        # Median-split build; a subtree over n keys has height n.bit_length()
+        stack = [(0, len(unique), None, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            mid = (lo + hi) // 2
+            node = BSTNode(unique[mid], None, self._epoch)
+            node._duplicate_count = counts[mid]
+            node.height = (hi - lo).bit_length()
+            if parent is None:
+                self.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            if lo < mid:
+                stack.append((lo, mid, node, True))
+            if mid + 1 < hi:
+                stack.append((mid + 1, hi, node, False))
+        
+        self._size = len(ordered)
     
     def _find_exact(self, node: Optional[BSTNode], key) -> Optional[BSTNode]:
         """Find exact match without bias"""
+        if self._default_cmp:
+            return self._find_exact_default(node, key)
+        return self._find_exact_cmp(node, key)
+    
+    @staticmethod
+    def _find_exact_default(node: Optional[BSTNode], key) -> Optional[BSTNode]:
+        """Exact-match descent using native < comparisons"""
         while node:
-            cmp = self._comparator(key, node.key)
+            node_key = node._key
+            if key < node_key:
+                node = node.left
+            elif node_key < key:
+                node = node.right
+            else:
+                return node
+        return None
+    
+    def _find_exact_cmp(self, node: Optional[BSTNode], key) -> Optional[BSTNode]:
+        """Exact-match descent using the custom comparator"""
+        comparator = self._comparator
+        while node:
+            cmp = comparator(key, node._key)
             if cmp == 0:
                 return node
             node = node.left if cmp < 0 else node.right
         return None
     
-    def _insert_and_balance(self, node: Optional[BSTNode], key, value) -> BSTNode:
-        """Recursive insert with AVL balancing on the way up"""
-        if node is None:
-            return BSTNode(key, value)
-        
-        cmp = self._comparator(key, node.key)
+    def _copy_path(self, key) -> BSTNode:
+        """Copy shared nodes from the root down to key's node; returns that node"""
+        epoch = self._epoch
+        node = self.root
+        if node.version != epoch:
+            node = self.root = node.copy(epoch)
+        if self._default_cmp:
+            while True:
+                node_key = node._key
+                if key < node_key:
+                    child = node.left
+                    if child.version != epoch:
+                        child = node.left = child.copy(epoch)
+                elif node_key < key:
+                    child = node.right
+                    if child.version != epoch:
+                        child = node.right = child.copy(epoch)
+                else:
+                    return node
+                node = child
+        
+        comparator = self._comparator
+        while True:
+            cmp = comparator(key, node._key)
+            if cmp < 0:
+                child = node.left
+                if child.version != epoch:
+                    child = node.left = child.copy(epoch)
+            elif cmp > 0:
+                child = node.right
+                if child.version != epoch:
+                    child = node.right = child.copy(epoch)
+            else:
+                return node
+            node = child
+    
+    def _insert_and_balance(self, key, value) -> BSTNode:
+        """Iterative insert with AVL balancing on the way back up the path.
         
-        if cmp < 0:
-            node.left = self._insert_and_balance(node.left, key, value)
+        Nodes on the path that are still shared with a snapshot are copied
+        during the descent, so rebalancing only ever writes to owned nodes.
+        """
+        path = []
+        epoch = self._epoch
+        node = self.root
+        if node.version != epoch:
+            node = self.root = node.copy(epoch)
+        if self._default_cmp:
+            while True:
+                went_left = key < node._key
+                path.append((node, went_left))
+                child = node.left if went_left else node.right
+                if child is None:
+                    break
+                if child.version != epoch:
+                    child = child.copy(epoch)
+                    if went_left:
+                        node.left = child
+                    else:
+                        node.right = child
+                node = child
+        else:
+            comparator = self._comparator
+            while True:
+                went_left = comparator(key, node._key) < 0
+                path.append((node, went_left))
+                child = node.left if went_left else node.right
+                if child is None:
+                    break
+                if child.version != epoch:
+                    child = child.copy(epoch)
+                    if went_left:
+                        node.left = child
+                    else:
+                        node.right = child
+                node = child
+        
+        new_node = BSTNode(key, value, epoch)
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = new_node
         else:
-            node.right = self._insert_and_balance(node.right, key, value)
+            parent.right = new_node
+        
+        # Walk back up, rebalancing and re-linking rotated subtrees
+        i = len(path) - 1
+        while i >= 0:
+            node = path[i][0]
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                if i == 0:
+                    self.root = subtree
+                else:
+                    grandparent, parent_went_left = path[i - 1]
+                    if parent_went_left:
+                        grandparent.left = subtree
+                    else:
+                        grandparent.right = subtree
+            i -= 1
         
-        # Update height and get balance factor
-        balance = node.update_height()
+        return new_node
+    
+    def _rebalance(self, node: BSTNode) -> BSTNode:
+        """Update height and rotate if unbalanced; returns the new subtree root"""
+        # Update height and get balance factor (inlined update_height)
+        left = node.left
+        right = node.right
+        lh = left.height if left else 0
+        rh = right.height if right else 0
+        node.height = lh + 1 if lh > rh else rh + 1
+        balance = rh - lh
         
         # Rebalance if needed
         if balance > 1:  # Right-heavy
-            if node.right:
-                right_balance = (node.right.right.height if node.right.right else 0) - \
-                               (node.right.left.height if node.right.left else 0)
+            nr = node.right
+            if nr:
+                rr = nr.right
+                rl = nr.left
+                right_balance = (rr.height if rr else 0) - (rl.height if rl else 0)
                 if right_balance < 0:  # Right-Left case
-                    node.right = self._rotate_right(node.right)
+                    node.right = self._rotate_right(nr)
             return self._rotate_left(node)
         
         if balance < -1:  # Left-heavy
-            if node.left:
-                left_balance = (node.left.right.height if node.left.right else 0) - \
-                              (node.left.left.height if node.left.left else 0)
+            nl = node.left
+            if nl:
+                lr = nl.right
+                ll = nl.left
+                left_balance = (lr.height if lr else 0) - (ll.height if ll else 0)
                 if left_balance > 0:  # Left-Right case
-                    node.left = self._rotate_left(node.left)
+                    node.left = self._rotate_left(nl)
             return self._rotate_right(node)
         
         return node
@@ -139,11 +350,18 @@ class BST:
         if y is None:
             return z
         
-        z.right = y.left
+        t2 = y.left
+        z.right = t2
         y.left = z
         
-        z.update_height()
-        y.update_height()
+        # z's children are now (z.left, t2); y's are (z, y.right)
+        zl = z.left
+        lh = zl.height if zl else 0
+        rh = t2.height if t2 else 0
+        zh = z.height = lh + 1 if lh > rh else rh + 1
+        yr = y.right
+        rh = yr.height if yr else 0
+        y.height = zh + 1 if zh > rh else rh + 1
         
         return y
     
@@ -153,11 +371,18 @@ class BST:
         if y is None:
             return z
         
-        z.left = y.right
+        t3 = y.right
+        z.left = t3
         y.right = z
         
-        z.update_height()
-        y.update_height()
+        # z's children are now (t3, z.right); y's are (y.left, z)
+        zr = z.right
+        lh = t3.height if t3 else 0
+        rh = zr.height if zr else 0
+        zh = z.height = lh + 1 if lh > rh else rh + 1
+        yl = y.left
+        lh = yl.height if yl else 0
+        y.height = lh + 1 if lh > zh else zh + 1
         
         return y
     
@@ -169,31 +394,60 @@ class BST:
             key: Key to search for
         
         Returns:
-            Node containing the key, or None if not found
+            Node containing the key, or None if not found. The node is
+            read-only and reflects the tree only until the next
+            create_snapshot or rollback; use update_value to change a value.
         """
         return self._find_exact(self.root, key)
     
+    def update_value(self, key, value) -> bool:
+        """
+        Replace the value stored for key without changing its count.
+        
+        Shared nodes are copied first, so snapshots keep the old value.
+        
+        Args:
+            key: Key whose value to replace
+            value: New value
+        
+        Returns:
+            True if the key was found, False otherwise
+        """
+        node = self._find_exact(self.root, key)
+        if node is None:
+            return False
+        if node.version != self._epoch:
+            node = self._copy_path(key)
+        node._value = value
+        return True
+    
     def inorder_traversal(self) -> Iterator:
         """
         Perform inorder traversal yielding keys in sorted order.
         Duplicates are yielded duplicate_count times.
         
-        Yields:
-            Keys in sorted order
+        One (key, duplicate_count) pair per node is cached until the next
+        insert or rollback, so repeated traversals of an unchanged tree skip
+        the walk while memory stays proportional to the unique keys.
+        
+        Returns:
+            Iterator over keys in sorted order
         """
-        yield from self._inorder(self.root)
+        if self._inorder_cache is None:
+            self._inorder_cache = tuple(self._inorder_runs())
+        return chain.from_iterable(starmap(repeat, self._inorder_cache))
     
-    def _inorder(self, node: Optional[BSTNode]) -> Iterator:
-        """Recursive inorder with duplicate expansion"""
-        if node is None:
-            return
-        
-        yield from self._inorder(node.left)
-        
-        for _ in range(node.metadata.duplicate_count):
-            yield node.key
-        
-        yield from self._inorder(node.right)
+    def _inorder_runs(self) -> Iterator[Tuple[any, int]]:
+        """Explicit-stack inorder walk yielding (key, duplicate_count) per node"""
+        stack = []
+        node = self.root
+        while node or stack:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node._key, node._duplicate_count
+            node = node.right
     
     def create_snapshot(self) -> int:
         """
@@ -202,15 +456,15 @@ class BST:
         Returns:
             Version ID for this snapshot
         """
-        version = self._version_counter
-        self._version_counter += 1
+        # Share the current nodes; later writes copy whatever they touch
+        self._snapshots.append((self.root, self._size))
+        self._epoch += 1
+        version = len(self._snapshots) - 1
         
-        if self.root:
-            self._snapshots[version] = self.root.clone()
-            self._snapshot_sizes[version] = self._size
-        else:
-            self._snapshots[version] = None
-            self._snapshot_sizes[version] = 0
+        # Evict the oldest live snapshot once the cap is exceeded
+        self._live_versions.append(version)
+        if self._max_snapshots is not None and len(self._live_versions) > self._max_snapshots:
+            self._snapshots[self._live_versions.popleft()] = None
         
         return version
     
@@ -224,13 +478,30 @@ class BST:
         Returns:
             True if rollback successful, False if version not found
         """
-        if version not in self._snapshots:
+        if not 0 <= version < len(self._snapshots) or self._snapshots[version] is None:
             return False
         
-        snapshot = self._snapshots[version]
-        self.root = snapshot.clone() if snapshot else None
-        self._size = self._snapshot_sizes[version]
+        self.root, self._size = self._snapshots[version]
+        self._epoch += 1
+        self._inorder_cache = None
+        
+        return True
+    
+    def drop_snapshot(self, version: int) -> bool:
+        """
+        Release a snapshot so nodes only it references can be freed.
+        
+        Args:
+            version: Snapshot version ID to drop
+        
+        Returns:
+            True if the snapshot was dropped, False if version not found
+        """
+        if not 0 <= version < len(self._snapshots) or self._snapshots[version] is None:
+            return False
         
+        self._snapshots[version] = None
+        self._live_versions.remove(version)
         return True
     
     def get_height(self) -> int:
@@ -1,12 +1,7 @@
 from typing import Optional, Callable, TypeVar, Generic, List, Tuple, Iterator, Dict, Any
-from dataclasses import dataclass
 from enum import Enum
 from collections import deque
-import threading
-from functools import wraps
-import weakref
-import copy
-import time
+from itertools import repeat
 import random
 
 T = TypeVar('T')
@@ -30,121 +25,66 @@ class DuplicateStrategy(Enum):
     REPLACE = "replace"
     COUNT = "count"
 
-@dataclass
-class NodeMetadata:
-    """Bloated metadata - most fields are unused"""
-    insertion_index: int = 0
-    access_count: int = 0
-    last_rebalance_height: int = 0
-    thread_id: Optional[int] = None
-    is_threaded: bool = False
-    duplicate_count: int = 1 
-    subtree_min: Optional[Any] = None
-    subtree_max: Optional[Any] = None
-    creation_timestamp: float = 0.0  
-
 class BSTNode(Generic[T]):
-    """Over-engineered node with weak refs and excessive tracking"""
-    __slots__ = ('key', 'value', 'left', 'right', 'parent', 'height',
-                 'balance_factor', 'metadata', '_size', '_depth', '__weakref__')
+    """Over-engineered node with excessive tracking.
+    
+    key, value, duplicate_count and access_count are read-only: snapshots
+    share nodes, so only the tree writes them, after copying shared nodes.
+    """
+    __slots__ = ('_key', '_value', 'left', 'right', 'height',
+                 'balance_factor', '_duplicate_count', '_access_count', '_size', 'version')
     
-    def __init__(self, key: T, value: any = None, parent: Optional['BSTNode'] = None):
-        self.key = key
-        self.value = value if value is not None else key
+    def __init__(self, key: T, value: any = None, version: int = 0):
+        self._key = key
+        self._value = value if value is not None else key
         self.left: Optional[BSTNode[T]] = None
         self.right: Optional[BSTNode[T]] = None
-        self.parent: Optional[weakref.ref] = weakref.ref(parent) if parent else None
         self.height: int = 1 
         self.balance_factor: int = 0  
-        self.metadata: NodeMetadata = NodeMetadata()
-        self.metadata.creation_timestamp = time.time()  
+        self._duplicate_count: int = 1
+        self._access_count: int = 0
         self._size: int = 1
-        self._depth: int = 0
+        self.version: int = version
     
-    def get_parent(self) -> Optional['BSTNode[T]']:
-        return self.parent() if self.parent else None
+    @property
+    def key(self) -> T:
+        return self._key
     
-    def update_height(self) -> None:
-        """CRITICAL: Required for AVL balancing"""
-        left_h = self.left.height if self.left else 0
-        right_h = self.right.height if self.right else 0
-        self.height = 1 + max(left_h, right_h)
-        self.balance_factor = right_h - left_h
+    @property
+    def value(self) -> any:
+        return self._value
     
-    def update_size(self) -> None:
-        """Updates subtree size - used in some algorithms"""
-        left_s = self.left._size if self.left else 0
-        right_s = self.right._size if self.right else 0
-        self._size = 1 + left_s + right_s
+    @property
+    def duplicate_count(self) -> int:
+        return self._duplicate_count
     
-    def update_depth(self, parent_depth: int = 0) -> None:
-        """Depth tracking - expensive and mostly unused"""
-        self._depth = parent_depth
-        if self.left:
-            self.left.update_depth(parent_depth + 1)
-        if self.right:
-            self.right.update_depth(parent_depth + 1)
+    @property
+    def access_count(self) -> int:
+        return self._access_count
     
-    def update_subtree_bounds(self) -> None:
-        """TRAP: Looks important but not used by required features"""
-        self.metadata.subtree_min = self.key
-        self.metadata.subtree_max = self.key
-        
-        if self.left:
-            self.left.update_subtree_bounds()
-            if self.left.metadata.subtree_min is not None:
-                self.metadata.subtree_min = min(self.metadata.subtree_min,
-                                                self.left.metadata.subtree_min)
-            if self.left.metadata.subtree_max is not None:
-                self.metadata.subtree_max = max(self.metadata.subtree_max,
-                                                self.left.metadata.subtree_max)
-        
-        if self.right:
-            self.right.update_subtree_bounds()
-            if self.right.metadata.subtree_min is not None:
-                self.metadata.subtree_min = min(self.metadata.subtree_min,
-                                                self.right.metadata.subtree_min)
-            if self.right.metadata.subtree_max is not None:
-                self.metadata.subtree_max = max(self.metadata.subtree_max,
-                                                self.right.metadata.subtree_max)
-    
-    def clone(self) -> 'BSTNode[T]':
-        """CRITICAL: Deep clone for snapshots"""
-        new_node = BSTNode(self.key, self.value)
+    def copy(self, version: int) -> 'BSTNode[T]':
+        """Shallow copy sharing both children, stamped with a new version"""
+        new_node = BSTNode(self._key, self._value, version)
+        new_node.left = self.left
+        new_node.right = self.right
         new_node.height = self.height
         new_node.balance_factor = self.balance_factor
+        new_node._duplicate_count = self._duplicate_count
         new_node._size = self._size
-        new_node._depth = self._depth
-        new_node.metadata = copy.deepcopy(self.metadata)
-        
-        if self.left:
-            new_node.left = self.left.clone()
-            new_node.left.parent = weakref.ref(new_node)
-        if self.right:
-            new_node.right = self.right.clone()
-            new_node.right.parent = weakref.ref(new_node)
-        
+        new_node._access_count = self._access_count
         return new_node
-
-def synchronized(func):
-    """Thread decorator - looks necessary but no concurrent usage"""
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        with self._lock:
-            return func(self, *args, **kwargs)
-    return wrapper
-
+    
 class AdvancedBST(Generic[T]):
     """
     TRAP DESIGN:
     - AVL rotations: MUST KEEP (performance requirement)
     - Duplicate count: MUST KEEP (traversal requirement)
     - Size tracking in snapshots: MUST KEEP (rollback requirement)
-    - Thread locks: CAN REMOVE (no concurrency requirement)
-    - Weak refs: CAN REMOVE (not needed for this use case)
     - Multiple strategies: CAN REMOVE (only COUNT needed)
-    - Timestamp in metadata: MUST REMOVE (breaks determinism)
-    - Subtree bounds: CAN REMOVE (not used)
+    - Extra traversal orders: CAN REMOVE (only inorder needed)
+    
+    Thread locks, weak parent refs, timestamps and subtree bounds have been
+    removed; snapshots share nodes via path copying.
     """
     
     def __init__(self, comparator: Optional[Callable[[T, T], int]] = None,
@@ -152,15 +92,17 @@ class AdvancedBST(Generic[T]):
                  duplicate_strategy: DuplicateStrategy = DuplicateStrategy.COUNT):
         self.root: Optional[BSTNode[T]] = None
         self._size: int = 0  
-        self._lock = threading.RLock()  
         self._comparator = comparator or (lambda a, b: (a > b) - (a < b))
+        # Lets the descent loops compare keys natively instead of via a lambda
+        self._cmp_is_default = comparator is None
         self._auto_balance = auto_balance  
         self._duplicate_strategy = duplicate_strategy
         self._modification_count = 0
         self._snapshots: Dict[int, BSTNode[T]] = {}  
         self._snapshot_metadata: Dict[int, Dict[str, Any]] = {}  
         self._current_version: int = 0
-        self._insertion_order: List[T] = []  
+        # Nodes stamped with an older epoch may be shared with a snapshot
+        self._epoch: int = 0
     
     def _compare(self, a: T, b: T) -> int:
         """REMOVABLE: Only COUNT strategy needed"""
@@ -171,91 +113,131 @@ class AdvancedBST(Generic[T]):
             return 1
         return result
     
-    @synchronized  
     def insert(self, key: T, value: any = None) -> BSTNode[T]:
-        """CRITICAL: Must handle duplicates correctly"""
-        self._insertion_order.append(key)  
+        """CRITICAL: Must handle duplicates correctly.
         
+        The returned node is read-only and reflects the tree only until the
+        next create_snapshot or rollback, after which writes go to a copy.
+        """
         if self.root is None:
-            self.root = BSTNode(key, value)
-            self.root.update_subtree_bounds()  
+            self.root = BSTNode(key, value, self._epoch)
             self._size += 1
             self._modification_count += 1
             return self.root
         
        
-        if self._duplicate_strategy == DuplicateStrategy.COUNT:
-            existing, _ = self._search_with_path(self.root, key, strict=True)
-            if existing:
-                existing.metadata.duplicate_count += 1
-                existing.value = value if value is not None else existing.value
-                self._size += 1  
-                return existing
+        node, path = self._insert_iterative(key, value)
         
-        node, path = self._insert_recursive(self.root, key, value, [])
-        
-        for n in reversed(path):
-            n.update_height() 
-            n.update_size()  
-            n.update_subtree_bounds() 
-        
-        if self._auto_balance:  
-            self._rebalance_path(path)
-        
-        if self.root:
-            self.root.update_depth()  
+        if node is path[-1]:  # key already present
+            if self._duplicate_strategy == DuplicateStrategy.COUNT:
+                node._duplicate_count += 1
+                node._value = value if value is not None else node._value
+                self._size += 1  
+                return node
+            node._value = value if value is not None else key
+        else:
+            self._rebalance_path(path, node)
         
         self._size += 1
         self._modification_count += 1
         return node
     
-    def _insert_recursive(self, node: BSTNode[T], key: T, value: any,
-                         path: List[BSTNode[T]]) -> Tuple[BSTNode[T], List[BSTNode[T]]]:
-        """Standard recursive insertion"""
-        path.append(node)
-        
-        if self._duplicate_strategy == DuplicateStrategy.REPLACE:
-            cmp = self._comparator(key, node.key)
+    def _insert_iterative(self, key: T, value: any) -> Tuple[BSTNode[T], List[BSTNode[T]]]:
+        """Iterative insertion; returns the new node and the ancestor path.
+        
+        Nodes still shared with a snapshot are copied on the way down, so the
+        caller may freely mutate every node on the returned path.
+        """
+        path: List[BSTNode[T]] = []
+        epoch = self._epoch
+        node = self.root
+        if node.version != epoch:
+            node = self.root = node.copy(epoch)
+        # Only the bias strategies remap ties; everything else compares directly
+        if self._duplicate_strategy in (DuplicateStrategy.LEFT_BIAS, DuplicateStrategy.RIGHT_BIAS):
+            compare = self._compare
+        elif self._cmp_is_default:
+            while True:
+                path.append(node)
+                node_key = node._key
+                if key < node_key:
+                    child = node.left
+                    if child is None:
+                        node.left = BSTNode(key, value, epoch)
+                        return node.left, path
+                    if child.version != epoch:
+                        child = node.left = child.copy(epoch)
+                    node = child
+                elif key > node_key:
+                    child = node.right
+                    if child is None:
+                        node.right = BSTNode(key, value, epoch)
+                        return node.right, path
+                    if child.version != epoch:
+                        child = node.right = child.copy(epoch)
+                    node = child
+                else:
+                    return node, path
         else:
-            cmp = self._compare(key, node.key)
-        
-        if cmp < 0:
-            if node.left is None:
-                node.left = BSTNode(key, value, parent=node)
-                node.update_height()
-                node.update_size()
-                return node.left, path
+            compare = self._comparator
+        
+        while True:
+            path.append(node)
+            cmp = compare(key, node._key)
+            if cmp < 0:
+                child = node.left
+                if child is None:
+                    node.left = BSTNode(key, value, epoch)
+                    return node.left, path
+                if child.version != epoch:
+                    child = node.left = child.copy(epoch)
+                node = child
+            elif cmp > 0:
+                child = node.right
+                if child is None:
+                    node.right = BSTNode(key, value, epoch)
+                    return node.right, path
+                if child.version != epoch:
+                    child = node.right = child.copy(epoch)
+                node = child
             else:
-                result, path = self._insert_recursive(node.left, key, value, path)
-                node.update_height()
-                node.update_size()
-                return result, path
-        elif cmp > 0:
-            if node.right is None:
-                node.right = BSTNode(key, value, parent=node)
-                node.update_height()
-                node.update_size()
-                return node.right, path
-            else:
-                result, path = self._insert_recursive(node.right, key, value, path)
-                node.update_height()
-                node.update_size()
-                return result, path
-        else:
-            node.value = value if value is not None else key
-            return node, path
+                return node, path
     
-    def _rebalance_path(self, path: List[BSTNode[T]]) -> None:
-        """CRITICAL: AVL balancing for O(log n) guarantee"""
-        for i in range(len(path) - 1, -1, -1):
+    def _rebalance_path(self, path: List[BSTNode[T]], child: BSTNode[T]) -> None:
+        """CRITICAL: AVL balancing for O(log n) guarantee
+        
+        Retraces from the new leaf ``child`` up through ``path``, adjusting each
+        ancestor's balance factor by one instead of recomputing heights from
+        its children. Heights only need touching while the subtree keeps
+        growing; rotations recompute the few nodes they move.
+        """
+        i = len(path) - 1
+        while i >= 0:
             node = path[i]
-            node.update_height()
+            node._size += 1
+            
+            if node.left is child:
+                node.balance_factor -= 1
+                grew = node.balance_factor < 0
+            else:
+                node.balance_factor += 1
+                grew = node.balance_factor > 0
             
-            if abs(node.balance_factor) > 1:
+            if self._auto_balance and abs(node.balance_factor) > 1:
+                # An insert rotation restores the subtree's pre-insert height
                 rotation_type = self._determine_rotation(node)
-                rotated = self._rotate(node, rotation_type, path[:i])
-                rotated.update_subtree_bounds()  
-                node.update_subtree_bounds()  
+                self._rotate(node, rotation_type, path[:i])
+                break
+            if not grew:
+                # Height unchanged here, so no ancestor can become unbalanced
+                break
+            node.height += 1
+            child = node
+            i -= 1
+        
+        # Remaining ancestors only gain one node in their subtree
+        for j in range(i):
+            path[j]._size += 1
     
     def _determine_rotation(self, node: BSTNode[T]) -> RotationType:
         """CRITICAL: Rotation logic"""
@@ -292,12 +274,6 @@ class AdvancedBST(Generic[T]):
         y.left = z
         z.right = t2
         
-        if t2:
-            t2.parent = weakref.ref(z)  
-        
-        y.parent = z.parent  
-        z.parent = weakref.ref(y) 
-        
         if ancestors:
             if ancestors[-1].left == z:
                 ancestors[-1].left = y
@@ -306,13 +282,21 @@ class AdvancedBST(Generic[T]):
         else:
             self.root = y
         
-        z.update_height()  
-        z.update_size()  
-        y.update_height()  
-        y.update_size()  
-        
-        z.update_subtree_bounds()  
-        y.update_subtree_bounds()  
+        # Fused height/balance/size update; z first since it is now y's child
+        zl = z.left
+        zr = z.right
+        lh = zl.height if zl else 0
+        rh = zr.height if zr else 0
+        z.height = 1 + (lh if lh > rh else rh)
+        z.balance_factor = rh - lh
+        z._size = 1 + (zl._size if zl else 0) + (zr._size if zr else 0)
+        yl = y.left
+        yr = y.right
+        lh = yl.height if yl else 0
+        rh = yr.height if yr else 0
+        y.height = 1 + (lh if lh > rh else rh)
+        y.balance_factor = rh - lh
+        y._size = 1 + (yl._size if yl else 0) + (yr._size if yr else 0)
         
         return y
     
@@ -326,12 +310,6 @@ class AdvancedBST(Generic[T]):
         y.right = z
         z.left = t3
         
-        if t3:
-            t3.parent = weakref.ref(z)
-        
-        y.parent = z.parent
-        z.parent = weakref.ref(y)
-        
         if ancestors:
             if ancestors[-1].left == z:
                 ancestors[-1].left = y
@@ -340,49 +318,104 @@ class AdvancedBST(Generic[T]):
         else:
             self.root = y
         
-        z.update_height()
-        z.update_size()
-        y.update_height()
-        y.update_size()
-        
-        z.update_subtree_bounds()
-        y.update_subtree_bounds()
+        # Fused height/balance/size update; z first since it is now y's child
+        zl = z.left
+        zr = z.right
+        lh = zl.height if zl else 0
+        rh = zr.height if zr else 0
+        z.height = 1 + (lh if lh > rh else rh)
+        z.balance_factor = rh - lh
+        z._size = 1 + (zl._size if zl else 0) + (zr._size if zr else 0)
+        yl = y.left
+        yr = y.right
+        lh = yl.height if yl else 0
+        rh = yr.height if yr else 0
+        y.height = 1 + (lh if lh > rh else rh)
+        y.balance_factor = rh - lh
+        y._size = 1 + (yl._size if yl else 0) + (yr._size if yr else 0)
         
         return y
     
-    @synchronized
     def search(self, key: T) -> Optional[BSTNode[T]]:
-        """Standard search"""
-        node, path = self._search_with_path(self.root, key, strict=True)
+        """Standard search; the node is read-only (see insert), use update_value"""
+        node = self._find(key)
         
         if node:
-            node.metadata.access_count += 1  
+            if node.version != self._epoch:
+                # Never bump a counter on a node a snapshot still holds
+                node = self._copy_path(key)
+            node._access_count += 1  
         
         return node
     
-    def _search_with_path(self, node: Optional[BSTNode[T]], key: T,
-                          path: Optional[List[BSTNode[T]]] = None,
-                          strict: bool = False) -> Tuple[Optional[BSTNode[T]], List[BSTNode[T]]]:
-        """Search with path tracking"""
-        if path is None:
-            path = []
-        
+    def update_value(self, key: T, value: any) -> bool:
+        """Replace key's value without touching its count; snapshots keep the old one"""
+        node = self._find(key)
         if node is None:
-            return None, path
-        
-        path.append(node)
-        
-        if strict:
-            cmp = self._comparator(key, node.key)
-        else:
-            cmp = self._compare(key, node.key)
-        
-        if cmp == 0:
-            return node, path
-        elif cmp < 0:
-            return self._search_with_path(node.left, key, path, strict)
-        else:
-            return self._search_with_path(node.right, key, path, strict)
+            return False
+        if node.version != self._epoch:
+            node = self._copy_path(key)
+        node._value = value
+        return True
+    
+    def _find(self, key: T) -> Optional[BSTNode[T]]:
+        """Iterative strict lookup without path tracking"""
+        node = self.root
+        if self._cmp_is_default:
+            while node is not None:
+                node_key = node._key
+                if key < node_key:
+                    node = node.left
+                elif key > node_key:
+                    node = node.right
+                else:
+                    return node
+            return None
+        
+        cmp = self._comparator
+        while node is not None:
+            c = cmp(key, node._key)
+            if c == 0:
+                return node
+            node = node.left if c < 0 else node.right
+        return None
+    
+    def _copy_path(self, key: T) -> BSTNode[T]:
+        """Copy shared nodes from the root down to key's node; returns that node"""
+        epoch = self._epoch
+        node = self.root
+        if node.version != epoch:
+            node = self.root = node.copy(epoch)
+        
+        if self._cmp_is_default:
+            while True:
+                node_key = node._key
+                if key < node_key:
+                    child = node.left
+                    if child.version != epoch:
+                        child = node.left = child.copy(epoch)
+                elif key > node_key:
+                    child = node.right
+                    if child.version != epoch:
+                        child = node.right = child.copy(epoch)
+                else:
+                    return node
+                node = child
+        
+        cmp = self._comparator
+        while True:
+            c = cmp(key, node._key)
+            if c < 0:
+                child = node.left
+                if child.version != epoch:
+                    child = node.left = child.copy(epoch)
+            elif c > 0:
+                child = node.right
+                if child.version != epoch:
+                    child = node.right = child.copy(epoch)
+            else:
+                return node
+            node = child
     
     def traverse(self, order: TraversalOrder = TraversalOrder.INORDER) -> Iterator[T]:
         """REMOVABLE: Only inorder needed"""
@@ -395,19 +428,24 @@ class AdvancedBST(Generic[T]):
         elif order == TraversalOrder.LEVELORDER:
             yield from self._level_order()
         elif order == TraversalOrder.MORRIS_INORDER:
-            yield from self.morris_traversal()
+            # Morris threading would rewire nodes shared with snapshots, so
+            # this yields the same order via the stack-based walk
+            yield from self._inorder_with_duplicates(self.root)
     
     def _inorder_with_duplicates(self, node: Optional[BSTNode[T]]) -> Iterator[T]:
         """CRITICAL: Must respect duplicate_count"""
-        if node is None:
-            return
-        
-        yield from self._inorder_with_duplicates(node.left)
-        
-        for _ in range(node.metadata.duplicate_count):
-            yield node.key
-        
-        yield from self._inorder_with_duplicates(node.right)
+        stack: List[BSTNode[T]] = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            dc = node._duplicate_count
+            if dc == 1:
+                yield node._key
+            else:
+                yield from repeat(node._key, dc)
+            node = node.right
     
     def _dfs_traverse(self, node: Optional[BSTNode[T]], order: TraversalOrder) -> Iterator[T]:
         """REMOVABLE: Other traversals not needed"""
@@ -415,15 +453,21 @@ class AdvancedBST(Generic[T]):
             return
         
         if order == TraversalOrder.PREORDER:
-            for _ in range(node.metadata.duplicate_count):
-                yield node.key
+            dc = node._duplicate_count
+            if dc == 1:
+                yield node._key
+            else:
+                yield from repeat(node._key, dc)
             yield from self._dfs_traverse(node.left, order)
             yield from self._dfs_traverse(node.right, order)
         elif order == TraversalOrder.POSTORDER:
             yield from self._dfs_traverse(node.left, order)
             yield from self._dfs_traverse(node.right, order)
-            for _ in range(node.metadata.duplicate_count):
-                yield node.key
+            dc = node._duplicate_count
+            if dc == 1:
+                yield node._key
+            else:
+                yield from repeat(node._key, dc)
     
     def _level_order(self) -> Iterator[T]:
         """REMOVABLE"""
@@ -433,91 +477,56 @@ class AdvancedBST(Generic[T]):
         queue = deque([self.root])
         while queue:
             node = queue.popleft()
-            for _ in range(node.metadata.duplicate_count):
-                yield node.key
+            dc = node._duplicate_count
+            if dc == 1:
+                yield node._key
+            else:
+                yield from repeat(node._key, dc)
             if node.left:
                 queue.append(node.left)
             if node.right:
                 queue.append(node.right)
     
-    def morris_traversal(self) -> Iterator[T]:
-        """REMOVABLE: Complex optimization"""
-        current = self.root
-        
-        while current:
-            if current.left is None:
-                for _ in range(current.metadata.duplicate_count):
-                    yield current.key
-                current = current.right
-            else:
-                predecessor = current.left
-                while predecessor.right and predecessor.right != current:
-                    predecessor = predecessor.right
-                
-                if predecessor.right is None:
-                    predecessor.right = current
-                    current = current.left
-                else:
-                    predecessor.right = None
-                    for _ in range(current.metadata.duplicate_count):
-                        yield current.key
-                    current = current.right
-    
-    @synchronized
     def create_snapshot(self) -> int:
-        """CRITICAL: Must save tree AND size"""
+        """CRITICAL: Must save tree AND size.
+        
+        The current root is shared rather than cloned; bumping the epoch makes
+        later inserts copy the nodes they touch instead of mutating them.
+        """
         if self.root:
-            snapshot_root = self.root.clone()
             version = self._modification_count
-            self._snapshots[version] = snapshot_root
+            self._snapshots[version] = self.root
+            self._epoch += 1
             self._snapshot_metadata[version] = {
                 'size': self._size,  
                 'modification_count': self._modification_count,
-                'timestamp': time.time(), 
-                'insertion_order': self._insertion_order.copy() 
             }
             self._current_version = version
             return version
         return -1
     
-    @synchronized
     def rollback(self, version: int) -> bool:
         """CRITICAL: Must restore tree AND size"""
         if version not in self._snapshots:
             return False
         
-        snapshot_root = self._snapshots[version]
-        self.root = snapshot_root.clone()
+        # Share the snapshot's nodes; the epoch bump protects them from writes
+        self.root = self._snapshots[version]
+        self._epoch += 1
         
         metadata = self._snapshot_metadata[version]
         self._size = metadata['size'] 
         self._modification_count = metadata['modification_count']
-        self._insertion_order = metadata['insertion_order'].copy()  
-        
-        if self.root:
-            self.root.update_depth()  
-            self._update_all_statistics(self.root) 
         
         self._current_version = version
         return True
     
-    def _update_all_statistics(self, node: BSTNode[T]) -> None:
-        """REMOVABLE: Extra statistics"""
-        if node is None:
-            return
-        
-        self._update_all_statistics(node.left)
-        self._update_all_statistics(node.right)
-        
-        node.update_height()
-        node.update_size()
-        node.update_subtree_bounds()
-    
     def __len__(self) -> int:
         return self._size
     
     def __contains__(self, key: T) -> bool:
-        return self.search(key) is not None
+        # Membership is a pure read; search() also bumps access counters
+        return self._find(key) is not None
     
     def __iter__(self) -> Iterator[T]:
         return self.traverse(TraversalOrder.INORDER)
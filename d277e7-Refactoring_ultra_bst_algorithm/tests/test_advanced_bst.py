@@ -0,0 +1,177 @@
+"""
+Invariant Tests for the Baseline AdvancedBST
+Guards the incremental AVL retrace and path-copy snapshots in repository_before.
+
+"""
+
+import random
+import unittest
+from repository_before.ultra_bst_algorithim import (
+    AdvancedBST, DuplicateStrategy, TraversalOrder
+)
+
+
+def _check_node_stats(test, node):
+    """Assert height, balance_factor and _size match the children; returns (height, size)"""
+    if node is None:
+        return 0, 0
+    lh, ls = _check_node_stats(test, node.left)
+    rh, rs = _check_node_stats(test, node.right)
+    test.assertEqual(node.height, 1 + max(lh, rh), f"height of {node.key}")
+    test.assertEqual(node.balance_factor, rh - lh, f"balance_factor of {node.key}")
+    test.assertEqual(node._size, 1 + ls + rs, f"_size of {node.key}")
+    return node.height, node._size
+
+
+def _freeze(node):
+    """Capture a subtree's structure and per-node fields as nested tuples"""
+    if node is None:
+        return None
+    return (node.key, node.value, node.duplicate_count, node.height, node.balance_factor,
+            node._size, node.access_count, _freeze(node.left), _freeze(node.right))
+
+
+class TestAdvancedBSTInvariants(unittest.TestCase):
+    """Node statistics stay consistent after incremental rebalancing"""
+
+    def test_random_inserts_keep_node_stats(self):
+        """Test every node's stats match its children after random inserts"""
+        for strategy in DuplicateStrategy:
+            for auto_balance in (True, False):
+                rng = random.Random(f"{strategy.value}-{auto_balance}")
+                bst = AdvancedBST(duplicate_strategy=strategy, auto_balance=auto_balance)
+                for _ in range(400):
+                    bst.insert(rng.randint(0, 150))
+                with self.subTest(strategy=strategy, auto_balance=auto_balance):
+                    _check_node_stats(self, bst.root)
+
+    def test_random_inserts_stay_balanced(self):
+        """Test AVL balance holds and inorder stays sorted"""
+        rng = random.Random(7)
+        keys = [rng.randint(0, 500) for _ in range(2000)]
+        bst = AdvancedBST()
+        for key in keys:
+            bst.insert(key)
+
+        _check_node_stats(self, bst.root)
+        stack = [bst.root]
+        while stack:
+            node = stack.pop()
+            if node:
+                self.assertLessEqual(abs(node.balance_factor), 1)
+                stack.extend((node.left, node.right))
+        self.assertEqual(list(bst), sorted(keys))
+        self.assertEqual(len(bst), len(keys))
+
+    def test_sequential_inserts_height(self):
+        """Test sequential inserts keep logarithmic height"""
+        bst = AdvancedBST()
+        for i in range(1, 3001):
+            bst.insert(i)
+
+        _check_node_stats(self, bst.root)
+        self.assertLessEqual(bst.root.height, 14)
+
+    def test_custom_comparator(self):
+        """Test stats and order with a reversing comparator"""
+        bst = AdvancedBST(comparator=lambda a, b: (b > a) - (b < a))
+        rng = random.Random(3)
+        keys = [rng.randint(0, 100) for _ in range(300)]
+        for key in keys:
+            bst.insert(key)
+
+        _check_node_stats(self, bst.root)
+        self.assertEqual(list(bst), sorted(keys, reverse=True))
+
+
+class TestAdvancedBSTSnapshots(unittest.TestCase):
+    """Stored snapshots are never mutated by later operations"""
+
+    def test_snapshots_unchanged_by_later_operations(self):
+        """Test inserts, duplicates, searches, handle writes and rollbacks leave snapshots intact"""
+        rng = random.Random(11)
+        bst = AdvancedBST()
+        frozen = {}
+        handles = []
+        for step in range(600):
+            roll = rng.random()
+            if roll < 0.05:
+                version = bst.create_snapshot()
+                if version >= 0:
+                    frozen[version] = _freeze(bst._snapshots[version])
+            elif roll < 0.08 and frozen:
+                self.assertTrue(bst.rollback(rng.choice(list(frozen))))
+            elif roll < 0.15:
+                node = bst.search(rng.randint(0, 80))
+                if node:
+                    handles.append(node)
+            elif roll < 0.22 and handles:
+                # Handles may predate any snapshot; writes through them must not land
+                node = rng.choice(handles)
+                with self.assertRaises(AttributeError):
+                    node.value = ("mutated", step)
+                with self.assertRaises(AttributeError):
+                    node.duplicate_count += 1
+                # A rollback may have removed the handle's key from the live tree
+                present = node.key in bst
+                self.assertEqual(bst.update_value(node.key, ("updated", step)), present)
+                if present:
+                    self.assertEqual(bst.search(node.key).value, ("updated", step))
+            else:
+                # Small key range so many inserts hit existing keys
+                handles.append(bst.insert(rng.randint(0, 80)))
+            _check_node_stats(self, bst.root)
+
+        # A later snapshot taken at the same version replaces the earlier one
+        for version, tree in frozen.items():
+            self.assertEqual(_freeze(bst._snapshots[version]), tree)
+
+    def test_node_handle_stale_after_snapshot(self):
+        """Test handles taken before a snapshot keep the snapshot's view"""
+        bst = AdvancedBST()
+        for key in [50, 30, 70]:
+            bst.insert(key)
+        node = bst.search(30)
+        version = bst.create_snapshot()
+
+        bst.insert(30)
+        self.assertEqual(node.duplicate_count, 1)
+        self.assertEqual(bst.search(30).duplicate_count, 2)
+
+        self.assertTrue(bst.update_value(30, "mutated"))
+        self.assertTrue(bst.rollback(version))
+        self.assertEqual(bst.search(30).value, 30)
+
+    def test_rollback_restores_contents(self):
+        """Test rollback restores keys, duplicate counts and size"""
+        bst = AdvancedBST()
+        for key in [50, 30, 70, 30]:
+            bst.insert(key)
+        version = bst.create_snapshot()
+
+        for key in [30, 80, 90, 10, 50]:
+            bst.insert(key)
+        self.assertTrue(bst.rollback(version))
+        self.assertEqual(list(bst), [30, 30, 50, 70])
+        self.assertEqual(len(bst), 4)
+
+        bst.insert(30)
+        self.assertTrue(bst.rollback(version))
+        self.assertEqual(bst.search(30).duplicate_count, 2)
+
+    def test_morris_order_matches_inorder(self):
+        """Test MORRIS_INORDER yields inorder without touching snapshot nodes"""
+        bst = AdvancedBST()
+        for key in [40, 20, 60, 20, 10, 50]:
+            bst.insert(key)
+        version = bst.create_snapshot()
+        before = _freeze(bst._snapshots[version])
+
+        partial = bst.traverse(TraversalOrder.MORRIS_INORDER)
+        self.assertEqual(next(partial), 10)
+        self.assertEqual(list(bst.traverse(TraversalOrder.MORRIS_INORDER)), list(bst))
+        self.assertEqual(_freeze(bst._snapshots[version]), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,7 +35,18 @@ class TestBSTConstraints(unittest.TestCase):
             bst.insert(key)
         
         self.assertEqual(len(bst), 7)
-    
+
+    def test_insert_returns_inserted_node(self):
+        """Test insert returns the new node, not the root"""
+        bst = BST()
+
+        for key in [50, 30, 70]:
+            bst.insert(key)
+
+        node = bst.insert(20)
+        self.assertEqual(node.key, 20)
+        self.assertIs(node, bst.search(20))
+
     def test_search_existing(self):
         """Test search for existing keys"""
         bst = BST()
@@ -72,7 +83,23 @@ class TestBSTConstraints(unittest.TestCase):
         result = list(bst.inorder_traversal())
         expected = sorted(keys)
         self.assertEqual(result, expected)
-    
+
+    def test_traversal_reflects_mutations(self):
+        """Test repeated traversals see inserts and rollbacks"""
+        bst = BST()
+
+        bst.insert(20)
+        bst.insert(10)
+        version = bst.create_snapshot()
+        self.assertEqual(list(bst.inorder_traversal()), [10, 20])
+
+        bst.insert(30)
+        bst.insert(10)
+        self.assertEqual(list(bst.inorder_traversal()), [10, 10, 20, 30])
+
+        bst.rollback(version)
+        self.assertEqual(list(bst.inorder_traversal()), [10, 20])
+
     def test_contains_operator(self):
         """Test __contains__ operator"""
         bst = BST()
@@ -146,7 +173,7 @@ class TestBSTConstraints(unittest.TestCase):
         node2 = bst.insert(50)
         
         self.assertEqual(node1.key, node2.key)
-        self.assertEqual(node1.metadata.duplicate_count, 2)
+        self.assertEqual(node1.duplicate_count, 2)
     
     def test_duplicate_value_update(self):
         """Test that duplicate insertion can update value"""
@@ -157,7 +184,7 @@ class TestBSTConstraints(unittest.TestCase):
         
         node = bst.search(50)
         self.assertEqual(node.value, "second")
-        self.assertEqual(node.metadata.duplicate_count, 2)
+        self.assertEqual(node.duplicate_count, 2)
     
     # =========================================================================
     # CONSTRAINT 3: Snapshot & Rollback
@@ -207,6 +234,52 @@ class TestBSTConstraints(unittest.TestCase):
         result = list(bst)
         self.assertEqual(result, [30, 50, 50])
         self.assertEqual(len(bst), 3)
+
+    def test_returned_nodes_are_read_only(self):
+        """Test node handles cannot write into snapshot history"""
+        bst = BST()
+
+        node = bst.insert(50)
+        version = bst.create_snapshot()
+        with self.assertRaises(AttributeError):
+            node.value = "mutated"
+        with self.assertRaises(AttributeError):
+            node.duplicate_count = 5
+        with self.assertRaises(AttributeError):
+            bst.search(50).key = 99
+
+        bst.rollback(version)
+        self.assertEqual(bst.search(50).value, 50)
+
+    def test_update_value_preserves_snapshot(self):
+        """Test update_value changes the live tree but not snapshots"""
+        bst = BST()
+
+        bst.insert(50, "first")
+        bst.insert(30)
+        version = bst.create_snapshot()
+
+        self.assertTrue(bst.update_value(50, "second"))
+        self.assertEqual(bst.search(50).value, "second")
+        self.assertEqual(bst.search(50).duplicate_count, 1)
+        self.assertFalse(bst.update_value(99, "missing"))
+
+        bst.rollback(version)
+        self.assertEqual(bst.search(50).value, "first")
+
+    def test_node_handle_stale_after_snapshot(self):
+        """Test handles taken before a snapshot keep the snapshot's view"""
+        bst = BST()
+
+        node = bst.insert(50)
+        version = bst.create_snapshot()
+        bst.insert(50)
+
+        self.assertEqual(node.duplicate_count, 1)
+        self.assertEqual(bst.search(50).duplicate_count, 2)
+
+        bst.rollback(version)
+        self.assertIs(bst.search(50), node)
     
     def test_multiple_snapshots(self):
         """Test multiple snapshots coexist"""
@@ -236,8 +309,19 @@ class TestBSTConstraints(unittest.TestCase):
         
         bst.insert(10)
         success = bst.rollback(999)
-        
+
         self.assertFalse(success)
+
+    def test_rollback_negative_version(self):
+        """Test rollback rejects negative versions"""
+        bst = BST()
+
+        bst.insert(10)
+        bst.create_snapshot()
+        bst.insert(20)
+
+        self.assertFalse(bst.rollback(-1))
+        self.assertEqual(list(bst), [10, 20])
     
     def test_snapshot_empty_tree(self):
         """Test snapshot of empty tree"""
@@ -363,8 +447,7 @@ class TestBSTConstraints(unittest.TestCase):
         """Test snapshot creation and rollback performance"""
         bst = BST()
         
-        for i in range(10000):
-            bst.insert(i)
+        bst.bulk_load(range(10000))
         
         start = time.time()
         version = bst.create_snapshot()
@@ -407,8 +490,7 @@ class TestBSTConstraints(unittest.TestCase):
         """Test operations maintain O(log n) after rollback"""
         bst = BST()
         
-        for i in range(5000):
-            bst.insert(i)
+        bst.bulk_load(range(5000))
         
         version = bst.create_snapshot()
         
@@ -496,7 +578,40 @@ class TestBSTConstraints(unittest.TestCase):
         
         bst.rollback(v2)
         self.assertEqual(len(bst), 3)
-    
+
+    def test_drop_snapshot(self):
+        """Test dropped snapshots can no longer be restored"""
+        bst = BST()
+
+        bst.insert(10)
+        v1 = bst.create_snapshot()
+        bst.insert(20)
+        v2 = bst.create_snapshot()
+
+        self.assertTrue(bst.drop_snapshot(v1))
+        self.assertFalse(bst.drop_snapshot(v1))
+        self.assertFalse(bst.rollback(v1))
+
+        bst.insert(30)
+        self.assertTrue(bst.rollback(v2))
+        self.assertEqual(list(bst), [10, 20])
+
+    def test_max_snapshots_evicts_oldest(self):
+        """Test max_snapshots keeps only the newest snapshots"""
+        bst = BST(max_snapshots=2)
+
+        versions = []
+        for key in [10, 20, 30]:
+            bst.insert(key)
+            versions.append(bst.create_snapshot())
+
+        self.assertEqual(len(set(versions)), 3)
+        self.assertFalse(bst.rollback(versions[0]))
+        self.assertTrue(bst.rollback(versions[1]))
+        self.assertEqual(list(bst), [10, 20])
+        self.assertTrue(bst.rollback(versions[2]))
+        self.assertEqual(list(bst), [10, 20, 30])
+
     # =========================================================================
     # EDGE CASES & STRESS TESTS
     # =========================================================================
@@ -552,6 +667,42 @@ class TestBSTConstraints(unittest.TestCase):
         height = bst.get_height()
         self.assertLess(height, 20)
 
+    def test_bulk_load_empty_tree(self):
+        """Test bulk load builds a balanced tree with duplicate counts"""
+        bst = BST()
+
+        keys = [i % 1000 for i in range(5000)] + list(range(1000, 10000))
+        bst.bulk_load(keys)
+
+        self.assertEqual(len(bst), len(keys))
+        self.assertEqual(list(bst), sorted(keys))
+        self.assertEqual(bst.search(500).duplicate_count, 5)
+        self.assertEqual(bst.get_height(), 14)
+
+        bst.insert(10000)
+        self.assertIsNotNone(bst.search(10000))
+        self.assertLessEqual(bst.get_height(), 20)
+
+    def test_bulk_load_custom_comparator(self):
+        """Test bulk load honours a custom comparator"""
+        def reverse_cmp(a, b):
+            return (b > a) - (b < a)
+
+        bst = BST(comparator=reverse_cmp)
+        bst.bulk_load([50, 30, 70, 30, 20])
+
+        self.assertEqual(list(bst), [70, 50, 30, 30, 20])
+
+    def test_bulk_load_non_empty_tree(self):
+        """Test bulk load into an existing tree falls back to inserts"""
+        bst = BST()
+
+        bst.insert(50)
+        bst.bulk_load([30, 50, 70])
+
+        self.assertEqual(list(bst), [30, 50, 50, 70])
+        self.assertEqual(len(bst), 4)
+
 
 class TestBSTIntegration(unittest.TestCase):
     """Integration tests simulating real-world usage"""